@@ -0,0 +1,24 @@
+"""Loader for the extraction configuration file."""
+
+import functools
+import sys
+from typing import Any
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+@functools.lru_cache(maxsize=None)
+def load_config(path: str = "./extract/config.toml") -> dict[str, Any]:
+    """Load the extraction configuration, parsing each file only once.
+
+    Args:
+        path (str, optional): The path to the configuration file. Defaults to "./extract/config.toml".
+
+    Returns:
+        dict[str, Any]: The parsed configuration.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
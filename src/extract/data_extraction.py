@@ -1,26 +1,39 @@
+import functools
+import itertools
+import operator
+import orjson
 import pandas as pd
-import json
-from typing import Any
-import toml
-
-from loguru import logger
+import pyarrow
+from pyarrow import csv as pyarrow_csv
+from typing import Any, Callable, Optional
 
+from extract.config_loader import load_config
 # Import dynamic schema creation function
 from extract.data_validation import DynamicSchema
 
 # Set up logger
-from utils.logging.logger import setup_logging
+from utils.logging.logger import logger, setup_logging
 
 setup_logging()
 
-# Load configuration
-config = toml.load("./extract/config.toml")
+# Read buffer size for JSON sources, large enough to amortize the read syscalls
+READ_BUFFER_SIZE = 64 * 1024
+
+# Arrow types used to parse the schema columns of CSV sources, other columns are inferred
+ARROW_TYPE_MAP = {
+    'Bool': pyarrow.bool_(),
+    'DateTime': pyarrow.timestamp('ns'),
+    'Float': pyarrow.float64(),
+    'Int': pyarrow.int64(),
+    'String': pyarrow.string(),
+}
 
 class DataReader:
     """Base class for data readers."""
-    def __init__(self, file_path: str, schema_name: str, columns: list[str] = None):
+    def __init__(self, file_path: str, schema_name: str, columns: Optional[list[list]] = None):
         self.file_path = file_path
         self.columns = columns
+        self.schema_name = schema_name
         # Instantiate the schema using the dynamic schema creator
         self.schema = DynamicSchema.from_config(schema_name)
 
@@ -35,44 +48,75 @@ class CSVReader(DataReader):
     """Reader class for CSV data."""
     def read_data(self) -> pd.DataFrame:
         logger.info(f"Reading CSV data from {self.file_path}")
-        data = pd.read_csv(self.file_path)
+        # Parse with the Arrow CSV reader using the schema types, skipping type inference for them.
+        # Coerced columns are left to pandera, which converts or reports the values Arrow rejects
+        column_types = {
+            field_name: ARROW_TYPE_MAP[field_config['type']]
+            for field_name, field_config in load_config()['schemas'][self.schema_name].items()
+            if field_config['type'] in ARROW_TYPE_MAP and not field_config.get('coerce', False)
+        }
+        # Empty cells of string columns are missing values, as with pd.read_csv
+        table = pyarrow_csv.read_csv(
+            self.file_path,
+            convert_options=pyarrow_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+        )
+        data = table.to_pandas()
         return self.validate_data(data)
 
+def column_getter(column: list) -> tuple[str, Callable[[dict], Any]]:
+    """Resolve a configured column into its output name and a function picking it from a record.
+
+    Columns are either `[key]` or, for nested values, `[[parent], [child]]`.
+    """
+    if len(column) > 1:
+        path = tuple(part[0] for part in column)
+        return path[-1], lambda record: functools.reduce(operator.getitem, path, record)
+    return column[0], operator.itemgetter(column[0])
+
 class JSONLReader(DataReader):
     """Reader class for JSON Lines data."""
+    def __init__(self, file_path: str, schema_name: str, columns: Optional[list[list]] = None, chunksize: int = 100_000):
+        super().__init__(file_path, schema_name, columns)
+        self.chunksize = chunksize
+        # Resolve the configured columns once instead of interpreting them for every record
+        self.column_getters = dict(column_getter(col) for col in columns) if columns else None
+
     def read_data(self) -> pd.DataFrame:
         logger.info(f"Reading JSONL data from {self.file_path}")
-        with open(self.file_path, 'r') as file:
-            data = [json.loads(line) for line in file]
-            columns = [key for key in data[0].keys()]
-            df_data = []
-            if self.columns:
-                columns = [cols[-1][0] if len(cols) > 1 else cols[-1] for cols in self.columns]
-                for element in data:
-                    df_data.append([
-                        element[col[0][0]][col[1][0]] if len(col) > 1 else element[col[0]] for col in self.columns
-                        ])
-                data = df_data
-        
-            df = pd.DataFrame(data, columns=columns)
+        chunks = []
+        with open(self.file_path, 'rb', buffering=READ_BUFFER_SIZE) as file:
+            # Decode the file in chunks of lines so only one chunk of records is resident at a time
+            while records := [orjson.loads(line) for line in itertools.islice(file, self.chunksize)]:
+                chunks.append(self.select_columns(records))
+        df = pd.concat(chunks, ignore_index=True, copy=False)
         return self.validate_data(df)
 
+    def select_columns(self, records: list[dict]) -> pd.DataFrame:
+        """Build a dataframe with the configured (possibly nested) columns of a chunk of records."""
+        if not self.column_getters:
+            return pd.DataFrame(records)
+        return pd.DataFrame({name: [get(record) for record in records] for name, get in self.column_getters.items()})
+
 class JSONReader(DataReader):
     """Reader class for JSON data."""
     def read_data(self) -> pd.DataFrame:
         logger.info(f"Reading JSON data from {self.file_path}")
-        with open(self.file_path, 'r') as file:
-            data = pd.DataFrame(json.load(file))
+        with open(self.file_path, 'rb', buffering=READ_BUFFER_SIZE) as file:
+            data = pd.DataFrame(orjson.loads(file.read()))
         return self.validate_data(data)
 
+# Reader constructors by the reader name used in the data sources configuration
+READERS: dict[str, Callable[[dict[str, Any]], DataReader]] = {
+    'CSVReader': lambda sc: CSVReader(sc['path'], sc['schema']),
+    'JSONLReader': lambda sc: JSONLReader(sc['path'], sc['schema'], sc.get('columns'), sc.get('chunksize', 100_000)),
+    'JSONReader': lambda sc: JSONReader(sc['path'], sc['schema'], sc.get('columns')),
+}
+
 def reader_factory(data_source: str) -> DataReader:
     """Factory function to instantiate data readers based on configuration."""
-    source_config = config['data_sources'][data_source]
-    if source_config['reader'] == 'CSVReader':
-        return CSVReader(source_config['path'], source_config['schema'])
-    elif source_config['reader'] == 'JSONLReader':
-        return JSONLReader(source_config['path'], source_config['schema'], source_config.get('columns'))
-    elif source_config['reader'] == 'JSONReader':
-        return JSONReader(source_config['path'], source_config['schema'], source_config.get('columns'))
-    else:
+    source_config = load_config()['data_sources'][data_source]
+    try:
+        reader = READERS[source_config['reader']]
+    except KeyError:
         raise ValueError(f"Unknown reader type: {source_config['reader']}")
+    return reader(source_config)
@@ -1,22 +1,125 @@
-import toml
+import ast
+import functools
+from types import CodeType
+from typing import Any, Optional
+
 import pandera as pa
 
-# Load the configuration file
-config = toml.load("./extract/config.toml")
+from extract.config_loader import load_config
+
+# Pandera data types most used in the schemas configuration
+TYPE_MAP = {
+    'Bool': pa.Bool,
+    'Category': pa.Category,
+    'Date': pa.Date,
+    'DateTime': pa.DateTime,
+    'Decimal': pa.Decimal,
+    'Float': pa.Float,
+    'Float16': pa.Float16,
+    'Float32': pa.Float32,
+    'Float64': pa.Float64,
+    'Int': pa.Int,
+    'Int8': pa.Int8,
+    'Int16': pa.Int16,
+    'Int32': pa.Int32,
+    'Int64': pa.Int64,
+    'String': pa.String,
+    'Timedelta': pa.Timedelta,
+}
+
+# Operators evaluated the same way on a scalar and elementwise on a whole column
+COMPARISON_OPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+ARITHMETIC_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+SIGN_OPS = (ast.UAdd, ast.USub)
+
+
+def is_vectorizable_value(node: ast.AST) -> bool:
+    """Check whether a node is arithmetic over x and constants."""
+    if isinstance(node, ast.Name):
+        return node.id == 'x'
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, (bool, int, float, str))
+    if isinstance(node, ast.BinOp):
+        return (
+            isinstance(node.op, ARITHMETIC_OPS)
+            and is_vectorizable_value(node.left)
+            and is_vectorizable_value(node.right)
+        )
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, SIGN_OPS) and is_vectorizable_value(node.operand)
+    return False
+
+
+def is_vectorizable_condition(node: ast.AST) -> bool:
+    """Check whether a node is a boolean combination of comparisons between values."""
+    if isinstance(node, ast.Compare):
+        return all(isinstance(op, COMPARISON_OPS) for op in node.ops) and all(
+            is_vectorizable_value(operand) for operand in [node.left] + node.comparators
+        )
+    if isinstance(node, ast.BoolOp):
+        return all(is_vectorizable_condition(value) for value in node.values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return is_vectorizable_condition(node.operand)
+    return False
+
+
+class VectorizedCheckTransformer(ast.NodeTransformer):
+    """Rewrite scalar boolean logic into the elementwise operators understood by pandas Series."""
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        # Split chained comparisons such as "0 <= x <= 10" into "(0 <= x) & (x <= 10)"
+        operands = [node.left] + node.comparators
+        comparisons = [
+            ast.Compare(left=left, ops=[op], comparators=[right])
+            for left, op, right in zip(operands, node.ops, operands[1:])
+        ]
+        result: ast.expr = comparisons[0]
+        for comparison in comparisons[1:]:
+            result = ast.BinOp(left=result, op=ast.BitAnd(), right=comparison)
+        return result
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        result = node.values[0]
+        for value in node.values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return result
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=node.operand)
+        return node
+
+
+def compile_vectorized_check(check_expr: str) -> Optional[CodeType]:
+    """Compile a check expression to run on a whole column, or None if it is not vectorizable."""
+    tree = ast.parse(check_expr, mode='eval')
+    # "not", "and" and "or" are only rewritten into "~", "&" and "|" over boolean comparisons
+    if not is_vectorizable_condition(tree.body):
+        return None
+    tree = ast.fix_missing_locations(VectorizedCheckTransformer().visit(tree))
+    return compile(tree, '<check>', 'eval')
 
 
 class DynamicSchema:
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def from_config(schema_name: str) -> pa.DataFrameSchema:
-        schema_config = config['schemas'][schema_name]
+        schema_config = load_config()['schemas'][schema_name]
         fields = {}
 
         for field_name, field_config in schema_config.items():
-            # Retrieve Pandera data type correctly from the dtypes module or directly from pa
+            # Retrieve Pandera data type from the lookup table, or directly from pa for the others
+            pandera_type: Any
             try:
                 if field_config['type'].startswith('Datetime'):
                     # Special handling for datetime types as they need to be instantiated
-                    pandera_type = eval(f"pa.{field_config['type']}()")
+                    pandera_type = pa.DateTime()
+                elif field_config['type'] in TYPE_MAP:
+                    pandera_type = TYPE_MAP[field_config['type']]
                 else:
                     pandera_type = getattr(pa, field_config['type'])
             except AttributeError:
@@ -26,7 +129,19 @@ class DynamicSchema:
             checks = []
             if 'checks' in field_config:
                 check_expr = field_config['checks']
-                checks.append(pa.Check(lambda x: eval(check_expr), error=f"Check failed: {check_expr}", element_wise=True))
+                # Compile the expression once instead of parsing it on every evaluation,
+                # evaluating it over the whole column when it only uses comparisons/arithmetic
+                code = compile_vectorized_check(check_expr)
+                element_wise = code is None
+                if element_wise:
+                    code = compile(check_expr, '<check>', 'eval')
+                checks.append(
+                    pa.Check(
+                        lambda x, _c=code: eval(_c, {'x': x}),
+                        error=f"Check failed: {check_expr}",
+                        element_wise=element_wise,
+                    )
+                )
 
             # Coerce option handling
             coerce = field_config.get('coerce', False)
@@ -36,5 +151,3 @@ class DynamicSchema:
 
         # Return a DataFrameSchema with the dynamically created fields
         return pa.DataFrameSchema(fields)
-    
-            
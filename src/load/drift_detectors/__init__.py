@@ -2,6 +2,8 @@
 
 The drift detectors are used to detect drift between two datasets."""
 
+from typing import Any, List, Tuple
+
 import pandas as pd
 from load.drift_detectors.base_detector import BaseDriftDetector
 from load.drift_detectors.categorical_data import (
@@ -16,9 +18,22 @@ from load.drift_detectors.numerical_data import (
     ZTest,
 )
 
+DETECTORS = {
+    "z_test": ZTest,
+    "psi_calculator": PSICalculator,
+    "chi_squared_test": ChiSquaredTest,
+    "cramers_v_test": CramersVTest,
+    "ks_test": KSTest,
+    "cusum": CUSUM,
+    "kl_divergence": KLDivergence,
+}
+
 
 def get_drift_detector(
-    detector_name: str, historical_data: pd.DataFrame, recent_data: pd.DataFrame
+    detector_name: str,
+    historical_data: pd.DataFrame,
+    recent_data: pd.DataFrame,
+    **params: Any,
 ) -> BaseDriftDetector:
     """Get the drift detector handler based on the name.
 
@@ -26,21 +41,34 @@ def get_drift_detector(
     - detector_name: str, the name of the drift detector.
     - historical_data: pd.DataFrame, the historical dataset.
     - recent_data: pd.DataFrame, the recent dataset.
+    - params: Any, extra parameters passed to the drift detector.
 
     Returns:
     - object: the drift detector handler.
     """
-    detectors = {
-        "z_test": ZTest,
-        "psi_calculator": PSICalculator,
-        "chi_squared_test": ChiSquaredTest,
-        "cramers_v_test": CramersVTest,
-        "ks_test": KSTest,
-        "cusum": CUSUM,
-        "kl_divergence": KLDivergence,
-    }
-
-    detector_class = detectors.get(detector_name)
-    if not detector_class:
+    try:
+        detector_class = DETECTORS[detector_name]
+    except KeyError:
         raise ValueError(f"Handler does not exist: {detector_name}")
-    return detector_class(historical_data, recent_data)
+    return detector_class(historical_data, recent_data, **params)
+
+
+def detect_drift_columns(
+    drift_detector: BaseDriftDetector, column_names: List[str]
+) -> List[Tuple[bool, float]]:
+    """Detect drift on several columns with the same drift detector.
+
+    Detectors that implement a vectorized `detect_drift_columns` handle all the
+    columns in one call, the others are run column by column.
+
+    Args:
+    - drift_detector: BaseDriftDetector, the drift detector to use.
+    - column_names: List[str], the names of the columns to check.
+
+    Returns:
+    - List[Tuple[bool, float]]: the drift decision and statistic for each column.
+    """
+    batch_detect = getattr(drift_detector, "detect_drift_columns", None)
+    if batch_detect is not None:
+        return batch_detect(column_names)
+    return [drift_detector.detect_drift(column_name) for column_name in column_names]
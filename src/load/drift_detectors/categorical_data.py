@@ -5,7 +5,66 @@ from typing import Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2_contingency
+from scipy.stats import chi2, fisher_exact
+
+
+def build_contingency_table(historical: pd.Series, recent: pd.Series) -> np.ndarray:
+    """
+    Build the 2 x k contingency table of category counts for two independent samples.
+
+    Args:
+    - historical: pd.Series, the historical sample of the categorical column.
+    - recent: pd.Series, the recent sample of the categorical column.
+
+    Returns:
+    - np.ndarray with the historical counts in the first row and the recent counts in the second.
+    """
+    # Factorize both samples together so they share the same category codes
+    codes, categories = pd.factorize(pd.concat([historical, recent], ignore_index=True))
+    n_categories = len(categories)
+    historical_codes = codes[: len(historical)]
+    recent_codes = codes[len(historical) :]
+
+    # Missing values are coded as -1 and are left out of the counts
+    historical_counts = np.bincount(
+        historical_codes[historical_codes >= 0], minlength=n_categories
+    )
+    recent_counts = np.bincount(recent_codes[recent_codes >= 0], minlength=n_categories)
+
+    return np.vstack([historical_counts, recent_counts])
+
+
+def chi_squared_statistic(contingency_table: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute the chi-squared test of independence on a contingency table.
+
+    Matches scipy.stats.chi2_contingency (including Yates' correction for one degree of
+    freedom) while computing the statistic as a single fused reduction.
+
+    Args:
+    - contingency_table: np.ndarray, the table of observed counts.
+
+    Returns:
+    - Tuple[float, float] with the chi-squared statistic and its p-value.
+    """
+    observed = contingency_table.astype(np.float64)
+    expected = np.outer(observed.sum(axis=1), observed.sum(axis=0)) / observed.sum()
+    if np.any(expected == 0):
+        raise ValueError(
+            "The internally computed table of expected frequencies has a zero element."
+        )
+
+    dof = (observed.shape[0] - 1) * (observed.shape[1] - 1)
+    if dof == 0:
+        return 0.0, 1.0
+
+    deviations = observed - expected
+    if dof == 1:
+        # Yates' correction: move each observed count up to 0.5 towards its expected value
+        deviations = np.sign(deviations) * np.maximum(np.abs(deviations) - 0.5, 0)
+
+    statistic = np.einsum("ij,ij->", deviations, deviations / expected)
+    return statistic, chi2.sf(statistic, dof)
 
 
 @dataclass
@@ -37,12 +96,28 @@ class ChiSquaredTest:
         - p-value from the chi-squared test
         """
         # Create a contingency table from the column data
-        contingency_table = pd.crosstab(
+        contingency_table = build_contingency_table(
             self.historical_data[column_name], self.recent_data[column_name]
         )
 
-        # Perform the chi-squared test on the contingency table
-        _, p_value, _, _ = chi2_contingency(contingency_table)
+        # Drop empty samples and categories, they carry no information for the test
+        row_sums = contingency_table.sum(axis=1)
+        column_sums = contingency_table.sum(axis=0)
+        contingency_table = contingency_table[row_sums > 0][:, column_sums > 0]
+        row_sums = row_sums[row_sums > 0]
+        column_sums = column_sums[column_sums > 0]
+
+        # With a single category or an empty sample there is nothing to compare
+        if min(contingency_table.shape) < 2:
+            return False, 1.0
+
+        min_expected = row_sums.min() * column_sums.min() / contingency_table.sum()
+        if contingency_table.shape == (2, 2) and min_expected < 5:
+            # Use the exact test on small 2 x 2 tables where the chi-squared approximation fails
+            _, p_value = fisher_exact(contingency_table)
+        else:
+            # Perform the chi-squared test on the contingency table
+            _, p_value = chi_squared_statistic(contingency_table)
 
         # Decide if there is drift based on the p-value
         drift_detected = p_value < self.alpha
@@ -78,17 +153,17 @@ class CramersVTest:
         - p-value from the Cramer's V test
         """
         # Create a contingency table from the column data
-        contingency_table = pd.crosstab(
+        contingency_table = build_contingency_table(
             self.historical_data[column_name], self.recent_data[column_name]
         )
 
         # Perform the chi-squared test on the contingency table
-        chi2, p_value, _, _ = chi2_contingency(contingency_table)
+        chi2_statistic, p_value = chi_squared_statistic(contingency_table)
 
         # Calculate the Cramer's V statistic
-        n = contingency_table.sum().sum()
+        n = contingency_table.sum()
         min_dim = min(contingency_table.shape)
-        cramer_v = np.sqrt(chi2 / (n * (min_dim - 1)))
+        cramer_v = np.sqrt(chi2_statistic / (n * (min_dim - 1)))
 
         # Decide if there is drift based on the p-value
         drift_detected = p_value < self.alpha
@@ -1,12 +1,146 @@
 """Methods to detect drift in numeric data distributions."""
 
-from dataclasses import dataclass
-from typing import List, Tuple
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from numba import njit
 from scipy.stats import entropy, ks_2samp, norm
 
+# Results computed per (dataframe, column, ...) so that several detectors run on the
+# same table can share them. Entries are dropped when their dataframe is collected.
+_FRAME_CACHE: Dict[Tuple[Any, ...], Tuple[weakref.ref, Any]] = {}
+
+
+def cached_per_frame(
+    data: pd.DataFrame, key: Tuple[Any, ...], compute: Callable[[], Any]
+) -> Any:
+    """
+    Return the cached result for the given dataframe and key, computing it if needed.
+
+    Args:
+    - data: pd.DataFrame, the dataframe the result is computed from.
+    - key: Tuple[Any, ...], hashable values identifying the result within the dataframe.
+    - compute: Callable[[], Any], the function computing the result on a cache miss.
+
+    Returns:
+    - the cached or freshly computed result.
+    """
+    cache_key = (id(data),) + key
+    cached = _FRAME_CACHE.get(cache_key)
+    # The weak reference guards against an id reused by a newer dataframe
+    if cached is not None and cached[0]() is data:
+        return cached[1]
+
+    result = compute()
+    _FRAME_CACHE[cache_key] = (
+        weakref.ref(data, lambda _: _FRAME_CACHE.pop(cache_key, None)),
+        result,
+    )
+    return result
+
+
+def column_moments(data: pd.DataFrame, column_name: str) -> Tuple[float, float]:
+    """
+    Compute the mean and sample variance of a column, ignoring missing values.
+
+    Args:
+    - data: pd.DataFrame, the dataset holding the column.
+    - column_name: str, the name of the column.
+
+    Returns:
+    - Tuple[float, float] with the mean and the sample variance of the column.
+    """
+
+    def compute() -> Tuple[float, float]:
+        values = data[column_name].to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        mean = values.mean()
+        deviations = values - mean
+        variance = np.dot(deviations, deviations) / (values.size - 1)
+        return mean, variance
+
+    return cached_per_frame(data, ("moments", column_name), compute)
+
+
+@njit(cache=True)
+def cusum_drift_indices(
+    data: np.ndarray, target: float, threshold: float
+) -> np.ndarray:
+    """
+    Compiled CUSUM scan returning the indices where the cumulative sums exceed the threshold.
+
+    Args:
+    - data: np.ndarray, the float64 data series to monitor for drift.
+    - target: float, the target mean the deviations are measured from.
+    - threshold: float, the threshold for detecting a shift.
+
+    Returns:
+    - np.ndarray with the indices where drift occurs.
+    """
+    s_pos, s_neg = 0.0, 0.0
+    drift_indices = np.empty(data.size, np.int64)
+    n_drifts = 0
+
+    for i in range(data.size):
+        deviation = data[i] - target
+        s_pos = max(0.0, s_pos + deviation)
+        s_neg = min(0.0, s_neg + deviation)
+
+        if (s_pos > threshold) or (s_neg < -threshold):
+            drift_indices[n_drifts] = i
+            n_drifts += 1
+            # Reset the cumulative sum to avoid detecting the same shift multiple times
+            s_pos, s_neg = 0.0, 0.0
+
+    return drift_indices[:n_drifts]
+
+
+def historical_histogram(
+    data: pd.DataFrame, column_name: str, bins: Union[int, Tuple[float, ...]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the histogram of a column, cached per dataframe, column and bins.
+
+    Args:
+    - data: pd.DataFrame, the historical dataset.
+    - column_name: str, the name of the column.
+    - bins: Union[int, Tuple[float, ...]], the number of bins or the bin edges to use.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray] with the bin counts and the bin edges.
+    """
+    return cached_per_frame(
+        data,
+        ("histogram", column_name, bins),
+        lambda: np.histogram(data[column_name], bins=bins),
+    )
+
+
+def paired_histograms(
+    historical_data: pd.DataFrame,
+    recent_data: pd.DataFrame,
+    column_name: str,
+    bins: Union[int, Tuple[float, ...]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count both samples over the same bins, with the edges taken from the historical sample.
+
+    Args:
+    - historical_data: pd.DataFrame, the historical dataset.
+    - recent_data: pd.DataFrame, the recent dataset.
+    - column_name: str, the name of the column to discretize.
+    - bins: Union[int, Tuple[float, ...]], the number of bins or the bin edges to use.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray] with the historical and recent bin counts.
+    """
+    hist_counts, bin_edges = historical_histogram(historical_data, column_name, bins)
+    recent_counts, _ = np.histogram(recent_data[column_name], bins=bin_edges)
+    return hist_counts, recent_counts
+
 
 @dataclass
 class KSTest:
@@ -47,6 +181,27 @@ class KSTest:
 
         return drift_detected, p_value
 
+    def detect_drift_columns(self, column_names: List[str]) -> List[Tuple[bool, float]]:
+        """
+        Perform the KS test on several columns at once with a single vectorized call.
+
+        Args:
+        - column_names: List[str], the names of the columns to perform the KS test on.
+
+        Returns:
+        - List[Tuple[bool, float]] with the drift decision and the p-value for each column.
+        """
+        # Each matrix column is one sample, so scipy tests all of them along axis 0.
+        # The columns keep their own float width instead of being upcast to float64.
+        historical_matrix = self.historical_data[column_names].to_numpy()
+        recent_matrix = self.recent_data[column_names].to_numpy()
+
+        _, p_values = ks_2samp(historical_matrix, recent_matrix, axis=0)
+
+        drift_detected = p_values < self.alpha
+
+        return list(zip(drift_detected.tolist(), p_values.tolist()))
+
 
 @dataclass
 class PSICalculator:
@@ -61,6 +216,8 @@ class PSICalculator:
     - bins: int, the number of bins to use for discretizing continuous variables.
     - epsilon: float, a small value to add to bin counts to avoid division by zero.
     - threshold: float, the threshold for deciding drift (default is 0.1)
+    - bin_edges: Dict[str, List[float]], fixed bin edges per column, used instead of `bins`
+      so the same bins can be reused across monitoring runs.
     """
 
     historical_data: pd.DataFrame
@@ -68,6 +225,7 @@ class PSICalculator:
     bins: int = 10
     epsilon: float = 1e-5
     threshold: float = 0.1
+    bin_edges: Dict[str, List[float]] = field(default_factory=dict)
 
     def detect_drift(self, column_name: str) -> tuple[bool, float]:
         """
@@ -80,22 +238,27 @@ class PSICalculator:
             - float, the PSI value for the column.
         """
         # Discretize the data into bins
-        hist_counts, bin_edges = np.histogram(
-            self.historical_data[column_name], bins=self.bins
+        bins: Union[int, Tuple[float, ...]] = (
+            tuple(self.bin_edges[column_name])
+            if column_name in self.bin_edges
+            else self.bins
+        )
+        hist_counts, recent_counts = paired_histograms(
+            self.historical_data, self.recent_data, column_name, bins
         )
-        recent_counts, _ = np.histogram(self.recent_data[column_name], bins=bin_edges)
-
-        # Add epsilon to avoid division by zero
-        hist_counts = hist_counts + self.epsilon
-        recent_counts = recent_counts + self.epsilon
 
-        # Normalize the counts to get probabilities
-        hist_probs = hist_counts / sum(hist_counts)
-        recent_probs = recent_counts / sum(recent_counts)
+        # Add epsilon to avoid division by zero and normalize the counts to get probabilities,
+        # reusing the same buffers for every step
+        hist_probs = np.add(hist_counts, self.epsilon, dtype=np.float64)
+        hist_probs /= hist_probs.sum()
+        recent_probs = np.add(recent_counts, self.epsilon, dtype=np.float64)
+        recent_probs /= recent_probs.sum()
 
         # Calculate PSI
-        psi_values = (recent_probs - hist_probs) * np.log(recent_probs / hist_probs)
-        psi = sum(psi_values)
+        psi_values = np.divide(recent_probs, hist_probs)
+        np.log(psi_values, out=psi_values)
+        psi_values *= recent_probs - hist_probs
+        psi = psi_values.sum()
 
         drift_detected = psi > self.threshold
 
@@ -131,16 +294,14 @@ class ZTest:
         Returns:
         - Tuple[bool, float, float] indicating if drift is detected, the Z score, and the p-value
         """
-        mean1 = self.historical_data[column_name].mean()
-        mean2 = self.recent_data[column_name].mean()
-        std1 = self.historical_data[column_name].std()
-        std2 = self.recent_data[column_name].std()
+        mean1, var1 = column_moments(self.historical_data, column_name)
+        mean2, var2 = column_moments(self.recent_data, column_name)
 
         n1 = len(self.historical_data)
         n2 = len(self.recent_data)
 
         # Calculate the pooled standard deviation and Z score
-        pooled_std = np.sqrt(std1**2 / n1 + std2**2 / n2)
+        pooled_std = np.sqrt(var1 / n1 + var2 / n2)
         z_score = (mean1 - mean2) / pooled_std
 
         # Determine the critical Z score from the confidence level
@@ -182,20 +343,15 @@ class CUSUM:
         Returns:
         - Tuple[bool, List[int]] indicating if drift is detected and the indices where drift occurs.
         """
-        s_pos, s_neg = 0, 0
-        drift_indices = []
-        target_mean = self.historical_data[column_name].mean()
-        data = self.recent_data[column_name].concat(self.historical_data[column_name])
-
-        for i, x in enumerate(data):
-            deviation = x - target_mean
-            s_pos = max(0, s_pos + deviation)
-            s_neg = min(0, s_neg + deviation)
+        target_mean, _ = column_moments(self.historical_data, column_name)
+        data = np.concatenate(
+            [
+                self.recent_data[column_name].to_numpy(dtype=np.float64),
+                self.historical_data[column_name].to_numpy(dtype=np.float64),
+            ]
+        )
 
-            if (s_pos > self.threshold) or (s_neg < -self.threshold):
-                drift_indices.append(i)
-                # Reset the cumulative sum to avoid detecting the same shift multiple times
-                s_pos, s_neg = 0, 0
+        drift_indices = cusum_drift_indices(data, target_mean, self.threshold).tolist()
 
         drift_detected = len(drift_indices) > 0
         return drift_detected, drift_indices
@@ -213,12 +369,15 @@ class KLDivergence:
         - recent_data: pd.DataFrame, the recent dataset
         - num_bins: int, the number of bins to use for discretizing continuous variables.
         - threshold: float, the threshold for deciding drift (default is 0.1)
+        - bin_edges: Dict[str, List[float]], fixed bin edges per column, used instead of
+          `num_bins` so the same bins can be reused across monitoring runs.
     """
 
     historical_data: pd.DataFrame
     recent_data: pd.DataFrame
     num_bins: int = 10
     threshold: float = 0.1
+    bin_edges: Dict[str, List[float]] = field(default_factory=dict)
 
     def detect_drift(self, column_name: str) -> Tuple[bool, float]:
         """
@@ -231,14 +390,18 @@ class KLDivergence:
             - float, the KLD value for the column.
         """
         # Discretize the data into bins
-        hist_counts, bin_edges = np.histogram(
-            self.historical_data[column_name], bins=self.num_bins
+        bins: Union[int, Tuple[float, ...]] = (
+            tuple(self.bin_edges[column_name])
+            if column_name in self.bin_edges
+            else self.num_bins
+        )
+        hist_counts, recent_counts = paired_histograms(
+            self.historical_data, self.recent_data, column_name, bins
         )
-        recent_counts, _ = np.histogram(self.recent_data[column_name], bins=bin_edges)
 
-        # Add epsilon to avoid division by zero
-        hist_probs = hist_counts / sum(hist_counts)
-        recent_probs = recent_counts / sum(recent_counts)
+        # Normalize the counts to get probabilities
+        hist_probs = hist_counts / hist_counts.sum()
+        recent_probs = recent_counts / recent_counts.sum()
 
         # Calculate KLD
         kld = entropy(hist_probs, recent_probs)
@@ -1,23 +1,171 @@
 """Drift monitoring main module."""
 
 import os
+import pathlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import numpy as np
 import pandas as pd
-import toml
-from loguru import logger
-
-
-from utils.logging.logger import setup_logging
-from load.drift_detectors import get_drift_detector
-
-
-setup_logging("config.toml", os.path.dirname(__file__))
+import pyarrow
+from pyarrow import csv as pyarrow_csv
+from pyarrow import parquet as pyarrow_parquet
+
+
+from utils.logging.logger import logger, setup_logging
+from load.drift_detectors import detect_drift_columns, get_drift_detector
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+CONFIG_PATH = pathlib.Path(__file__).parent / "config.toml"
+
+setup_logging(CONFIG_PATH)
+
+with open(CONFIG_PATH, "rb") as f:
+    config = tomllib.load(f)
+
+# Number of bytes parsed at a time from the monitored tables
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Arrow type used to read the monitored columns of each type, float32 is precise enough
+# for the drift statistics and halves the memory they scan
+COLUMN_TYPES = {"numeric": pyarrow.float32(), "categorical": pyarrow.string()}
+
+
+def split_samples(
+    data: pd.DataFrame, rng: np.random.Generator
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Split rows into the historical (80%) and current (20%) samples with a random mask.
+
+    Args:
+        data (pd.DataFrame): The rows to split.
+        rng (np.random.Generator): The generator drawing the mask.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The historical and current samples.
+    """
+    mask = rng.random(len(data)) < 0.8
+    return data.iloc[mask], data.iloc[~mask]
+
+
+def read_monitored_samples(table: dict[str, Any]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Read the monitored columns of a table split into the historical and current samples.
+
+    Parquet tables only deserialize the monitored columns, CSV tables are streamed in blocks
+    parsing only those columns and each block is split as it is read, so the whole table is
+    never held as a single frame next to its samples.
+
+    Args:
+        table (dict[str, Any]): The table configuration from the drift_detection section.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The historical and current samples, with categorical
+            columns stored as category codes.
+    """
+    # Only the monitored columns are read, with their types fixed up front
+    needed_columns = list(dict.fromkeys(column["name"] for column in table["columns"]))
+    column_types = {
+        column["name"]: COLUMN_TYPES[column["type"]] for column in table["columns"]
+    }
+    rng = np.random.default_rng(table.get("seed"))
+
+    if table["current_table"].endswith(".parquet"):
+        arrow_table = pyarrow_parquet.read_table(
+            table["current_table"], columns=needed_columns
+        )
+        # Floating point columns keep their width so large values do not overflow, the other
+        # columns are cast unsafely so integers float32 cannot represent exactly are rounded
+        arrow_table = arrow_table.cast(
+            pyarrow.schema(
+                [
+                    (
+                        field.name,
+                        field.type
+                        if pyarrow.types.is_floating(field.type)
+                        and pyarrow.types.is_floating(column_types[field.name])
+                        else column_types[field.name],
+                    )
+                    for field in arrow_table.schema
+                ]
+            ),
+            safe=False,
+        )
+        historical_data, current_data = split_samples(arrow_table.to_pandas(), rng)
+    else:
+        reader = pyarrow_csv.open_csv(
+            table["current_table"],
+            read_options=pyarrow_csv.ReadOptions(
+                block_size=table.get("block_size", CSV_BLOCK_SIZE)
+            ),
+            # Empty cells of string columns are missing values, as with pd.read_csv
+            convert_options=pyarrow_csv.ConvertOptions(
+                include_columns=needed_columns,
+                column_types=column_types,
+                strings_can_be_null=True,
+            ),
+        )
+        historical_chunks, current_chunks = [], []
+        for batch in reader:
+            historical_chunk, current_chunk = split_samples(batch.to_pandas(), rng)
+            historical_chunks.append(historical_chunk)
+            current_chunks.append(current_chunk)
+        historical_data = pd.concat(historical_chunks, ignore_index=True, copy=False)
+        current_data = pd.concat(current_chunks, ignore_index=True, copy=False)
+
+    # Categorical columns are stored as integer codes shared by both samples, missing values
+    # are left out of the categories
+    category_types = {
+        column["name"]: pd.CategoricalDtype(
+            pd.Index(historical_data[column["name"]].dropna().unique()).union(
+                current_data[column["name"]].dropna().unique()
+            )
+        )
+        for column in table["columns"]
+        if column["type"] == "categorical"
+    }
+    return historical_data.astype(category_types), current_data.astype(category_types)
+
+
+def detect_table_drift(table: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Drift detection for a single table.
+
+    Args:
+        table (dict[str, Any]): The table configuration from the drift_detection section.
+
+    Returns:
+        tuple[str, dict[str, Any]]: The table name and the drift status of each column.
+    """
+    table_status: dict[str, Any] = {}
+    logger.info(f"Started drift detection for {table['current_table']}")
+
+    historical_data, current_data = read_monitored_samples(table)
+
+    # Group the columns by method so each detector handles all its columns at once
+    columns_by_method: dict[str, list[str]] = {}
+    bin_edges_by_method: dict[str, dict[str, list[float]]] = {}
+    for column in table["columns"]:
+        columns_by_method.setdefault(column["method"], []).append(column["name"])
+        # Fixed bin edges can be configured for the histogram based methods
+        if "bin_edges" in column:
+            bin_edges_by_method.setdefault(column["method"], {})[column["name"]] = column["bin_edges"]
+
+    for method, column_names in columns_by_method.items():
+        params = {"bin_edges": bin_edges_by_method[method]} if method in bin_edges_by_method else {}
+        drift_detector = get_drift_detector(method, historical_data, current_data, **params)
+        logger.info(f"Started drift detection for {', '.join(column_names)}")
+        results = detect_drift_columns(drift_detector, column_names)
+
+        for column_name, (drift_detected, stat) in zip(column_names, results):
+            if np.isnan(stat) | np.isinf(stat):
+                stat = 0
+            table_status[column_name] = (drift_detected, stat)
 
-current_dir = os.path.dirname(__file__)
-with open(os.path.join(current_dir, "config.toml"), "r", encoding="utf-8") as f:
-    config = toml.load(f)
+    return table["current_table"], table_status
 
 
 def drift_monitoring() -> None:
@@ -29,33 +177,23 @@ def drift_monitoring() -> None:
     columns = []
     status_list = []
     stat_list = []
-    for table in config["drift_detection"]["tables"]:
-        drift_status[table["current_table"]] = {}
-        logger.info(f"Started drift detection for {table['current_table']}")
-
-        initial_table = pd.read_csv(table["current_table"])
-
-        # Split the table into historical and current data at 80%
-
-        historical_data = initial_table.sample(frac=0.8)
-        current_data = initial_table.drop(historical_data.index)
-
-        for column in table["columns"]:
-            tables.append(table["current_table"])
-            drift_detector = get_drift_detector(
-                column["method"], historical_data, current_data
-            )
-            logger.info(f"Started drift detection for {column['name']}")
-            drift_detected, stat = drift_detector.detect_drift(column["name"])
-            if np.isnan(stat) | np.isinf(stat):
-                stat = 0
-            drift_status[table["current_table"]].update(
-                {column["name"]: (drift_detected, stat)}
-            )
 
-            columns.append(column["name"])
-            status_list.append(drift_detected)
-            stat_list.append(stat)
+    # Tables are independent, so each one is read and checked in its own process
+    tables_config = config["drift_detection"]["tables"]
+    if not tables_config:
+        # There is nothing to check, and a pool needs at least one worker
+        logger.info(f"Drift status: {drift_status}")
+        return
+    max_workers = min(len(tables_config), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for table_name, table_status in executor.map(detect_table_drift, tables_config):
+            drift_status[table_name] = table_status
+
+            for column_name, (drift_detected, stat) in table_status.items():
+                tables.append(table_name)
+                columns.append(column_name)
+                status_list.append(drift_detected)
+                stat_list.append(stat)
 
     logger.info(f"Drift status: {drift_status}")
 
@@ -1,15 +1,33 @@
 """ Main entry point for the application. """
 
-from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pandas as pd
 
 from extract.data_extraction import reader_factory
 from transform.data_transformer import DataMerger, BusinessMetrics
 from load.main import drift_monitoring
-from utils.logging.logger import setup_logging
+from utils.logging.logger import logger, setup_logging
 
 # Initialize the logger
 setup_logging()
 
+def load_and_validate(source: str) -> Optional[pd.DataFrame]:
+    """Read and validate a data source, returning None if it could not be processed."""
+    try:
+        logger.info(f"Processing data source: {source}")
+        # Create the reader using the factory
+        reader = reader_factory(source)
+        # Read and validate data
+        data = reader.read_data()
+        logger.info(f"Data loaded and validated for {source}: {data.shape[0]} rows and {data.shape[1]} columns")
+        return data
+    except Exception as e:
+        logger.error(f"Error processing data source {source}: {e}")
+        logger.exception(e)
+        return None
+
 def main():
     # Define the data sources from config.toml
     data_sources = ['pays', 'prints', 'taps']
@@ -17,23 +35,16 @@ def main():
     # Dictionary to store the loaded dataframes
     dataframes = {}
 
-    for source in data_sources:
-        try:
-            logger.info(f"Processing data source: {source}")
-            # Create the reader using the factory
-            reader = reader_factory(source)
-            # Read and validate data
-            data = reader.read_data()
-            # Store the validated data in a dictionary
-            dataframes[source] = data
-            logger.info(f"Data loaded and validated for {source}: {data.shape[0]} rows and {data.shape[1]} columns")
-        except Exception as e:
-            logger.error(f"Error processing data source {source}: {e}")
-            logger.exception(e)
+    # Sources are independent, read and validate them concurrently (numpy/pandas release the GIL)
+    with ThreadPoolExecutor(max_workers=len(data_sources)) as executor:
+        for source, data in zip(data_sources, executor.map(load_and_validate, data_sources)):
+            if data is not None:
+                # Store the validated data in a dictionary
+                dataframes[source] = data
 
     for source, df in dataframes.items():
-        output_path = f"../data/validated_{source}.csv"
-        df.to_csv(output_path, index=False)
+        output_path = f"../data/validated_{source}.parquet"
+        df.to_parquet(output_path, index=False, compression="snappy", engine="pyarrow")
         logger.info(f"Validated data saved to {output_path}")
 
     # Merge the dataframes
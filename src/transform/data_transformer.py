@@ -1,9 +1,8 @@
 """Module to merge and transform data for analysis."""
 
 import pandas as pd
-from loguru import logger
 
-from utils.logging.logger import setup_logging
+from utils.logging.logger import logger, setup_logging
 
 # Initialize the logger
 setup_logging()
@@ -0,0 +1,73 @@
+"""Typed logging configuration built from the TOML configuration file."""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class SinkConfig:
+    """Configuration of a single logging sink.
+
+    Args:
+        name (str): The name of the handler for the sink, e.g. "console" or "file".
+        format (str): The loguru format string, resolved from the named formats.
+        level (str): The minimum level logged by the sink.
+        path (str | None): The file the sink writes to, for file sinks.
+        rotation (str | None): When the file is rotated, for file sinks.
+        retention (str | None): How long rotated files are kept, for file sinks.
+        enqueue (bool): Whether records are written from loguru's background worker.
+        buffer_size (int): The bytes gathered before each write to the log file, 1 writes
+            every line, for file sinks.
+        backtrace (bool): Whether tracebacks are extended beyond the catching frame.
+        diagnose (bool): Whether tracebacks show the values of the variables.
+
+    Extended tracebacks and variable values are slow to render, so both are off unless a sink
+    asks for them while debugging.
+    """
+
+    name: str
+    format: str
+    level: str
+    path: str | None = None
+    rotation: str | None = None
+    retention: str | None = None
+    enqueue: bool = True
+    buffer_size: int = 1
+    backtrace: bool = False
+    diagnose: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
+    """Configuration of the selected logging sinks.
+
+    Args:
+        sinks (tuple[SinkConfig, ...]): The sinks to set up, in the selected order.
+    """
+
+    sinks: tuple[SinkConfig, ...]
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "LoggingConfig":
+        """Build the typed configuration from the parsed TOML configuration.
+
+        Args:
+            config (dict[str, Any]): The parsed configuration file.
+
+        Raises:
+            ValueError: If a selected sink is missing or has invalid options.
+
+        Returns:
+            LoggingConfig: The typed configuration.
+        """
+        logging_config = config["logging"]
+        formats = logging_config["formats"]
+        sinks = []
+        for name in config["loggers_selection"]["loggers"]:
+            try:
+                options = dict(logging_config[name])
+                options["format"] = formats[options["format"]]
+                sinks.append(SinkConfig(name=name, **options))
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Invalid logging configuration for {name}: {e}")
+        return cls(sinks=tuple(sinks))
@@ -1,28 +1,34 @@
 """The handlers module for the logging package."""
 
+from utils.logging.config import SinkConfig
+
 from .base_handler import BaseHandler
 from .console_handler import ConsoleHandler
 from .file_handler import FileHandler
+from .uring_file_handler import UringFileHandler
+
+
+HANDLERS: dict[str, type[BaseHandler]] = {
+    "console": ConsoleHandler,
+    "file": FileHandler,
+    "uring_file": UringFileHandler,
+}
 
 
 def get_handler(
-    handler_name: str, config: dict[str, str]
-) -> ConsoleHandler | FileHandler | BaseHandler:
+    handler_name: str, config: SinkConfig
+) -> ConsoleHandler | FileHandler | UringFileHandler | BaseHandler:
     """Get the handler for the logger.
 
     Args:
         handler_name (str): The name of the handler.
-        config (dict[str, str]): The configuration.
+        config (SinkConfig): The configuration of the sink.
 
     Returns:
         ConsoleHandler | FileHandler | AppInsightsHandler | BlobHandler: The handler.
     """
-    handlers = {
-        "console": ConsoleHandler,
-        "file": FileHandler
-    }
-
-    handler_class = handlers.get(handler_name)
-    if not handler_class:
+    try:
+        handler_class = HANDLERS[handler_name]
+    except KeyError:
         raise ValueError(f"Handler does not exist: {handler_name}")
     return handler_class(config)
@@ -2,21 +2,41 @@
 
 from typing import Any
 
+from loguru import logger
+
+from utils.logging.config import SinkConfig
+
 
 class BaseHandler:
     """Base class for all handlers.
 
     Args:
-        config (dict[str, dict[str, str]]): The configuration.
+        config (SinkConfig): The configuration of the sink.
     """
 
-    def __init__(self, config: Any) -> None:
+    def __init__(self, config: SinkConfig) -> None:
         """Initialize the BaseHandler.
 
         Args:
-            config (dict[str, dict[str, str]]): The configuration.
+            config (SinkConfig): The configuration of the sink.
         """
         self.config = config
 
-    def setup(self) -> None:
-        """Setup the handler."""
+    def level_no(self) -> int:
+        """Get the numeric severity of the configured level.
+
+        Raises:
+            ValueError: If the level is not a level known by loguru.
+
+        Returns:
+            int: The severity of the level.
+        """
+        return logger.level(self.config.level).no
+
+    def spec(self) -> dict[str, Any]:
+        """Get the handler specification, the keyword arguments of `logger.add`.
+
+        Returns:
+            dict[str, Any]: The handler specification.
+        """
+        raise NotImplementedError
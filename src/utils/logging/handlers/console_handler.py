@@ -1,18 +1,42 @@
 """Console handler for logging."""
 
 import sys
-
-from loguru import logger
+from typing import Any, Callable, TextIO
 
 from .base_handler import BaseHandler
 
 
+def _stdout_sink() -> Callable[[str], None] | TextIO:
+    """Get the sink writing the records to the standard output as raw UTF-8 bytes.
+
+    Returns:
+        Callable[[str], None] | TextIO: The sink, or sys.stdout itself if it has no binary buffer.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        return sys.stdout
+    # Anything already written through the text layer goes out before the records
+    sys.stdout.flush()
+    write, flush = buffer.write, buffer.flush
+
+    def write_stdout(message: str) -> None:
+        write(message.encode("utf-8"))
+        flush()
+
+    return write_stdout
+
+
 class ConsoleHandler(BaseHandler):
     """Console handler for logging."""
 
-    def setup(self) -> None:
-        selected_format = self.config["logging"]["formats"][
-            self.config["logging"]["console"]["format"]
-        ]
-        level = self.config["logging"]["console"]["level"]
-        logger.add(sys.stdout, format=selected_format, level=level)
+    def spec(self) -> dict[str, Any]:
+        return {
+            # Skip the text layer encoding and locking of sys.stdout on every record
+            "sink": _stdout_sink(),
+            "format": self.config.format,
+            "level": self.level_no(),
+            # Callable sinks are not checked by loguru, records are colored on terminals only
+            "colorize": sys.stdout.isatty(),
+            "backtrace": self.config.backtrace,
+            "diagnose": self.config.diagnose,
+        }
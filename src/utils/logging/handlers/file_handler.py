@@ -1,6 +1,6 @@
 """File handler for logging."""
 
-from loguru import logger
+from typing import Any
 
 from .base_handler import BaseHandler
 
@@ -8,15 +8,18 @@ from .base_handler import BaseHandler
 class FileHandler(BaseHandler):
     """File handler for logging."""
 
-    def setup(self) -> None:
-        selected_format = self.config["logging"]["formats"][
-            self.config["logging"]["file"]["format"]
-        ]
-        level = self.config["logging"]["file"]["level"]
-        logger.add(
-            self.config["logging"]["file"]["path"],
-            rotation=self.config["logging"]["file"]["rotation"],
-            retention=self.config["logging"]["file"]["retention"],
-            format=selected_format,
-            level=level,
-        )
+    def spec(self) -> dict[str, Any]:
+        return {
+            "sink": self.config.path,
+            "rotation": self.config.rotation,
+            "retention": self.config.retention,
+            "format": self.config.format,
+            "level": self.level_no(),
+            # Write the records from loguru's background worker instead of the calling thread
+            "enqueue": self.config.enqueue,
+            # Line buffered by default, larger buffers gather the records into fewer writes
+            "buffering": self.config.buffer_size,
+            "catch": True,
+            "backtrace": self.config.backtrace,
+            "diagnose": self.config.diagnose,
+        }
@@ -0,0 +1,153 @@
+"""File handler for logging writing the records through io_uring on Linux hosts."""
+
+import os
+import platform
+import queue
+import threading
+from typing import Any, Optional
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+from .base_handler import BaseHandler
+from .file_handler import FileHandler
+
+# Maximum number of records submitted to the ring at once
+MAX_BATCH = 64
+
+
+def _kernel_version() -> tuple[int, ...]:
+    """Get the (major, minor) version of the running kernel."""
+    release = platform.release().split("-")[0]
+    return tuple(int(part) for part in release.split(".")[:2] if part.isdigit())
+
+
+# io_uring is available from Linux 5.1 and needs the optional liburing bindings
+URING_AVAILABLE = (
+    liburing is not None
+    and platform.system() == "Linux"
+    and _kernel_version() >= (5, 1)
+)
+
+
+class _UringFileSink:
+    """Sink appending the records to a file from a background thread through io_uring.
+
+    The records waiting in the queue are submitted together as linked writes, which the kernel
+    runs one after the other so the records keep their order. The file is opened in append
+    mode, so other sinks or processes writing to it are not overwritten.
+
+    Args:
+        path (str): The file the records are appended to.
+        max_batch (int, optional): The maximum number of records submitted at once.
+            Defaults to MAX_BATCH.
+    """
+
+    def __init__(self, path: str, max_batch: int = MAX_BATCH) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[Optional[bytes]] = queue.SimpleQueue()
+
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(max_batch, self._ring)
+
+        self._worker = threading.Thread(
+            target=self._run, name="uring-file-sink", daemon=True
+        )
+        self._worker.start()
+
+    def write(self, message: str) -> None:
+        """Queue a formatted record to be written by the background thread."""
+        self._queue.put(message.encode("utf-8"))
+
+    def stop(self) -> None:
+        """Write the queued records and release the ring and the file."""
+        self._queue.put(None)
+        self._worker.join()
+        liburing.io_uring_queue_exit(self._ring)
+        os.close(self._fd)
+
+    def _run(self) -> None:
+        while True:
+            buf = self._queue.get()
+            batch = []
+            # Gather the records already waiting, up to a full batch
+            while buf is not None:
+                batch.append(buf)
+                if len(batch) == self._max_batch:
+                    break
+                try:
+                    buf = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+            if buf is None:
+                return
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        if len(batch) == 1:
+            # A lone record is written directly, a ring round trip is not worth it
+            self._write_all(batch[0])
+            return
+
+        for i, buf in enumerate(batch):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            liburing.io_uring_prep_write(sqe, self._fd, buf, 0)
+            sqe.user_data = i
+            if i < len(batch) - 1:
+                sqe.flags |= liburing.IOSQE_IO_LINK
+        liburing.io_uring_submit_and_wait(self._ring, len(batch))
+
+        written = [0] * len(batch)
+        for _ in batch:
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            cqe = self._cqe[0]
+            try:
+                # A negative result, raised by the bindings, is a failed or cancelled write
+                # that did not write anything
+                written[cqe.user_data] = max(cqe.res, 0)
+            except OSError:
+                pass
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+
+        # A failed or short write cancels the rest of the chain, which is then written in order
+        for buf, count in zip(batch, written):
+            if count < len(buf):
+                self._write_all(buf[count:])
+
+    def _write_all(self, buf: bytes) -> None:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(self._fd, view) :]
+
+
+class UringFileHandler(BaseHandler):
+    """File handler for logging writing the records through io_uring.
+
+    The file is not rotated nor cleaned up by this handler. Falls back to the FileHandler when
+    io_uring or the liburing bindings are not available.
+    """
+
+    def spec(self) -> dict[str, Any]:
+        if not URING_AVAILABLE:
+            return FileHandler(self.config).spec()
+        if self.config.path is None:
+            raise ValueError(
+                f"Invalid logging configuration for {self.config.name}: missing path"
+            )
+        return {
+            "sink": _UringFileSink(self.config.path),
+            "format": self.config.format,
+            "level": self.level_no(),
+            # The sink and its thread only live in this process, forked processes such as the
+            # drift workers send their records to it through loguru's queue
+            "enqueue": True,
+            "catch": True,
+            "backtrace": self.config.backtrace,
+            "diagnose": self.config.diagnose,
+        }
@@ -1,35 +1,169 @@
-"""This module contains the logger setup function."""
+"""This module contains the logger setup function.
+
+The configuration is applied lazily: `setup_logging` only records which configuration to use
+and the handlers (and loguru itself) are set up the first time `logger` is used.
+
+`log` is the same logger with lazy message arguments: callables passed as arguments are only
+called when the record passes the level of a sink, e.g.
+`log.debug("State: {}", lambda: expensive_dump(state))`.
+"""
 
 import os
+import pathlib
+import re
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+if TYPE_CHECKING:
+    from loguru import HandlerConfig
+
+# Configuration file next to this module, used when no other configuration is given
+_DEFAULT_CONFIG_PATH = pathlib.Path(__file__).parent / "config.toml"
+
+# Parsed configuration files keyed by (path, modification time in ns)
+_CONFIG_CACHE: dict[tuple[os.PathLike | str, int], dict[str, Any]] = {}
+
+# Configuration file waiting to be applied on the first use of the logger
+_pending_config_path: Optional[os.PathLike | str] = None
+# Hash of the configuration the installed sinks were built from
+_LAST_CONFIG_HASH: Optional[int] = None
+_configure_lock = threading.Lock()
+
+# Top-level tables of the configuration files used by the logger, the others are not parsed
+_CONFIG_SECTIONS = frozenset({"logging", "loggers_selection"})
+# Header of a table or array of tables, capturing the top-level table it belongs to
+_TABLE_HEADER = re.compile(r"\s*\[\[?\s*([A-Za-z0-9_-]+)\s*[.\]]")
+
+
+def _parse_sections(text: str, sections: frozenset[str]) -> dict[str, Any]:
+    """Parse only the given top-level tables of a TOML document.
+
+    Args:
+        text (str): The TOML document.
+        sections (frozenset[str]): The top-level tables to parse.
+
+    Returns:
+        dict[str, Any]: The parsed tables found in the document.
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    kept_lines = []
+    keep = True
+    for line in text.splitlines(keepends=True):
+        header = _TABLE_HEADER.match(line)
+        if header is not None:
+            keep = header.group(1) in sections
+        if keep:
+            kept_lines.append(line)
+
+    try:
+        config = tomllib.loads("".join(kept_lines))
+    except tomllib.TOMLDecodeError:
+        # The slicing can cut through a multiline value, the whole document is parsed then
+        config = tomllib.loads(text)
+    return {key: value for key, value in config.items() if key in sections}
+
 
-import toml
-from loguru import logger
+def load_config(path: os.PathLike | str) -> dict[str, Any]:
+    """Load a logging configuration file, reusing the parsed result while it is unchanged.
 
-from utils.logging.handlers import get_handler
+    Args:
+        path (os.PathLike | str): The path to the configuration file.
+
+    Returns:
+        dict[str, Any]: The parsed configuration.
+    """
+    key = (path, os.stat(path).st_mtime_ns)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        # A single bulk read of the whole file, only the logging tables are parsed
+        with open(path, "rb") as f:
+            config = _parse_sections(f.read().decode("utf-8"), _CONFIG_SECTIONS)
+        _CONFIG_CACHE[key] = config
+    return config
+
+
+def setup_logging(config_path: os.PathLike | str = _DEFAULT_CONFIG_PATH) -> None:
+    """Setup the logging configuration, applied on the first use of the logger.
+
+    Args:
+        config_path (os.PathLike | str, optional): The path to the configuration file.
+            Defaults to the config.toml file of the logging package.
+    """
+    global _pending_config_path
+    with _configure_lock:
+        _pending_config_path = config_path
 
 
-def setup_logging(
-    config_path: str = "config.toml",
-    current_dir: str = os.path.dirname(__file__),
-) -> None:
-    """Setup the logging configuration.
+def _configure() -> None:
+    """Apply the pending logging configuration, if it was not applied by another thread."""
+    global _pending_config_path, _LAST_CONFIG_HASH
+    from loguru import logger as loguru_logger
+
+    from utils.logging.config import LoggingConfig
+    from utils.logging.handlers import BaseHandler, ConsoleHandler, get_handler
+
+    with _configure_lock:
+        if _pending_config_path is None:
+            return
+        try:
+            config = LoggingConfig.from_dict(load_config(_pending_config_path))
+            # The installed sinks are kept when the configuration did not change
+            config_hash = hash(config)
+            if config_hash == _LAST_CONFIG_HASH:
+                return
+
+            sinks = config.sinks
+            handlers: list[BaseHandler]
+            if len(sinks) == 1 and sinks[0].name == "console":
+                # Common case of a console only configuration, nothing to look up
+                handlers = [ConsoleHandler(sinks[0])]
+            else:
+                handlers = [get_handler(sink.name, sink) for sink in sinks]
+
+            # Install all the sinks at once, replacing the default one. The specs are the keyword
+            # arguments of logger.add, loguru's typed configurations do not list all of them
+            specs = [handler.spec() for handler in handlers]
+            loguru_logger.configure(handlers=cast("list[HandlerConfig]", specs))
+            _LAST_CONFIG_HASH = config_hash
+        finally:
+            # Only cleared once the sinks are installed, so other threads wait for them on the
+            # lock. A configuration that failed is dropped too, so only the first use raises
+            _pending_config_path = None
+
+
+class _LoggerHolder:
+    """Stand-in for the loguru logger that applies any pending configuration on first use.
 
     Args:
-        config_path (str, optional): The path to the configuration file. Defaults to "config.toml".
-        current_dir (str, optional): The current directory. Defaults to os.path.dirname(__file__).
+        **options (Any): Options of `logger.opt` applied to every record, if any.
     """
 
-    with open(os.path.join(current_dir, config_path), "r", encoding="utf-8") as f:
-        config = toml.load(f)
+    def __init__(self, **options: Any) -> None:
+        self._options = options
+        self._logger: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Configure the logging if needed and delegate to the loguru logger."""
+        if _pending_config_path is not None:
+            _configure()
+        if self._logger is None:
+            from loguru import logger as loguru_logger
+
+            self._logger = (
+                loguru_logger.opt(**self._options) if self._options else loguru_logger
+            )
+        return getattr(self._logger, name)
 
-    # remove the default logger
-    logger.remove()
-    selected_loggers = config["loggers_selection"]["loggers"]
 
-    for logger_name in selected_loggers:
-        handler = get_handler(logger_name, config)
-        handler.setup()
+logger: Any = _LoggerHolder()
+log: Any = _LoggerHolder(lazy=True)
 
 
 if __name__ == "__main__":
     setup_logging()
+    _configure()
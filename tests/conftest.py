@@ -0,0 +1,6 @@
+"""Make the pipeline packages importable the way they are when running from src."""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1] / "src"))
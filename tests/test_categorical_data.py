@@ -0,0 +1,54 @@
+"""Tests of the chi-squared statistic against scipy's contingency test."""
+
+import numpy as np
+import pytest
+from scipy.stats import chi2_contingency
+
+from load.drift_detectors.categorical_data import chi_squared_statistic
+
+
+@pytest.mark.parametrize("n_categories", [2, 3, 5, 10])
+def test_chi_squared_statistic_matches_scipy(n_categories):
+    rng = np.random.default_rng(n_categories)
+    for _ in range(125):
+        # Counts start at 1 so no expected frequency is zero
+        table = rng.integers(1, 1000, size=(2, n_categories))
+        statistic, p_value = chi_squared_statistic(table)
+
+        expected = chi2_contingency(table)
+        assert statistic == pytest.approx(expected.statistic, rel=1e-12, abs=1e-12)
+        assert p_value == pytest.approx(expected.pvalue, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        # One degree of freedom, with deviations larger and smaller than Yates' 0.5
+        [[10, 20], [30, 40]],
+        [[10, 11], [10, 10]],
+        [[5, 5], [5, 5]],
+    ],
+)
+def test_chi_squared_statistic_applies_yates_correction(table):
+    statistic, p_value = chi_squared_statistic(np.array(table))
+
+    expected = chi2_contingency(table, correction=True)
+    assert expected.dof == 1
+    assert statistic == pytest.approx(expected.statistic, rel=1e-12, abs=1e-12)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("table", [[[3, 4, 5]], [[3], [7]]])
+def test_chi_squared_statistic_without_degrees_of_freedom(table):
+    expected = chi2_contingency(table)
+
+    assert expected.dof == 0
+    assert chi_squared_statistic(np.array(table)) == (
+        expected.statistic,
+        expected.pvalue,
+    )
+
+
+def test_chi_squared_statistic_rejects_zero_expected_frequencies():
+    with pytest.raises(ValueError, match="zero element"):
+        chi_squared_statistic(np.array([[0, 4], [0, 6]]))
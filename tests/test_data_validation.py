@@ -0,0 +1,89 @@
+"""Tests of the dynamic schemas and the vectorized evaluation of their checks."""
+
+import pandas as pd
+import pytest
+
+import extract.data_validation
+from extract.data_validation import DynamicSchema, compile_vectorized_check
+
+COLUMNS = [
+    pd.Series([0, 1, 2, 5, 10, 11, -3]),
+    pd.Series([0.5, 2.5, float("nan"), 7.0]),
+]
+
+
+@pytest.mark.parametrize(
+    "check_expr",
+    [
+        "x > 1",
+        "0 <= x <= 10",
+        "x > 1 and x < 5",
+        "x < 1 or x >= 10",
+        "not x > 3",
+        "not (x > 1 and x < 5) or x == 10",
+        "-x + 2 * x != 5",
+        "x % 2 == 0",
+    ],
+)
+@pytest.mark.parametrize("column", COLUMNS)
+def test_vectorized_check_matches_element_wise(check_expr, column):
+    code = compile_vectorized_check(check_expr)
+    assert code is not None
+
+    element_wise = [bool(eval(check_expr, {"x": value})) for value in column]
+    vectorized = eval(code, {"x": column})
+    assert vectorized.dtype == bool
+    assert vectorized.tolist() == element_wise
+
+
+def test_vectorized_check_matches_element_wise_on_strings():
+    column = pd.Series(["a", "b", "c"])
+    code = compile_vectorized_check("x == 'a' or x == 'c'")
+
+    assert eval(code, {"x": column}).tolist() == [True, False, True]
+
+
+@pytest.mark.parametrize(
+    "check_expr",
+    [
+        "x in 'abc'",
+        "x not in (1, 2)",
+        "x is None",
+        "not x",
+        "x and x > 1",
+        "x > 1 or x",
+        "~x",
+        "x & 1 == 1",
+        "len(x) > 1",
+        "x.startswith('a')",
+        "x > y",
+        "x + 1",
+    ],
+)
+def test_non_vectorizable_checks_fall_back_to_element_wise(check_expr):
+    assert compile_vectorized_check(check_expr) is None
+
+
+@pytest.mark.parametrize(
+    "type_name, dtype",
+    [
+        ("Int", "int64"),
+        ("String", "str"),
+        ("UInt8", "uint8"),
+        ("Object", "object"),
+        ("Complex128", "complex128"),
+    ],
+)
+def test_schema_types_resolve_to_pandera_types(monkeypatch, type_name, dtype):
+    schemas = {"schemas": {type_name: {"column": {"type": type_name}}}}
+    monkeypatch.setattr(extract.data_validation, "load_config", lambda: schemas)
+
+    assert str(DynamicSchema.from_config(type_name).columns["column"].dtype) == dtype
+
+
+def test_unknown_schema_type_is_rejected(monkeypatch):
+    schemas = {"schemas": {"Unknown": {"column": {"type": "NotAType"}}}}
+    monkeypatch.setattr(extract.data_validation, "load_config", lambda: schemas)
+
+    with pytest.raises(ValueError, match="Invalid type specified: NotAType"):
+        DynamicSchema.from_config("Unknown")